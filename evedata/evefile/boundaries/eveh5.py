@@ -206,7 +206,6 @@ import logging
 from contextlib import contextmanager
 
 import h5py
-import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -293,6 +292,8 @@ class HDF5Item:
 
     """
 
+    __slots__ = ("filename", "name", "attributes", "_hdf5_filehandle")
+
     def __init__(self, filename="", name=""):
         self.filename = filename
         self.name = name
@@ -329,16 +330,16 @@ class HDF5Item:
         if not self.name:
             raise ValueError("Missing attribute name")
         with self._hdf5_file() as file:
-            try:
-                self.attributes = {
-                    key: value[0].decode()
-                    for key, value in file[self.name].attrs.items()  # noqa
-                }
-            except UnicodeDecodeError:
-                self.attributes = {
-                    key: value[0].decode(encoding="iso8859")
-                    for key, value in file[self.name].attrs.items()  # noqa
-                }
+            attributes = dict(file[self.name].attrs.items())  # noqa
+        try:
+            self.attributes = {
+                key: value[0].decode() for key, value in attributes.items()
+            }
+        except UnicodeDecodeError:
+            self.attributes = {
+                key: value[0].decode(encoding="iso8859")
+                for key, value in attributes.items()
+            }
 
     @contextmanager
     def _hdf5_file(self):
@@ -423,15 +424,25 @@ class HDF5Dataset(HDF5Item):
     Several subsequent calls to the :meth:`get_data` method will *not* read
     the data from the HDF5 file more than once for efficiency purposes.
 
+    If you are only interested in a part of a (large) dataset, use
+    :meth:`get_slice` and only this part will be read and returned:
+
+    .. code-block::
+
+        dataset = HDF5Dataset(filename="test.h5", name="/test")
+        first_rows = dataset.get_slice(slice(0, 10))
+
     The idea behind obtaining the attributes and data this way: being
     independent of the HDF5 file. By directly using the h5py package,
     the file would always need to be open to access the attributes.
 
     """
 
+    __slots__ = ("_data", "_dtype", "_shape")
+
     def __init__(self, filename="", name=""):
         super().__init__(filename=filename, name=name)
-        self._data = np.ndarray([0])
+        self._data = None
         self._dtype = None
         self._shape = None
 
@@ -530,7 +541,7 @@ class HDF5Dataset(HDF5Item):
             are accessed.
 
         """
-        if self._data.size > 0:
+        if self._data is not None and self._data.size > 0:
             return
         if not self.filename:
             raise ValueError("Missing attribute filename")
@@ -539,6 +550,55 @@ class HDF5Dataset(HDF5Item):
         with self._hdf5_file() as file:
             self._data = file[self.name][...]
 
+    def get_slice(self, slices):
+        """
+        Get a selection of data from HDF5 dataset.
+
+        Only the selection is read from the HDF5 file and returned,
+        which is useful if you are interested in only a part of a (large)
+        dataset. The :attr:`data` attribute is left untouched. If data
+        have been read before, the selection is taken from the
+        :attr:`data` attribute instead.
+
+        .. note::
+
+            If data have been read before, the selection is applied to
+            the :attr:`data` array and follows numpy indexing rules.
+            Otherwise, it is passed to h5py, which does not support all
+            selections numpy does, *e.g.* negative steps or unsorted
+            lists of indices. Hence, the same selection may fail or
+            succeed depending on whether data have been read before.
+
+        Parameters
+        ----------
+        slices : :class:`int` | :class:`slice` | :class:`tuple`
+            Selection of the data to be read from the HDF5 dataset.
+
+            Can be anything h5py supports as index of a dataset,
+            typically an integer, a :class:`slice` or :obj:`Ellipsis`,
+            or a tuple of those for multidimensional datasets.
+
+        Returns
+        -------
+        data : :class:`numpy.ndarray`
+            Selected data of the HDF5 dataset.
+
+        Raises
+        ------
+        ValueError
+            Raised if either filename or name are not provided and data are
+            obtained from HDF5 file.
+
+        """
+        if self._data is not None and self._data.size > 0:
+            return self._data[slices]
+        if not self.filename:
+            raise ValueError("Missing attribute filename")
+        if not self.name:
+            raise ValueError("Missing attribute name")
+        with self._hdf5_file() as file:
+            return file[self.name][slices]
+
 
 class HDF5Group(HDF5Item):
     # noinspection PyUnresolvedReferences
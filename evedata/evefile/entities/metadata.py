@@ -739,8 +739,8 @@ class MCAChannelCalibration:
 
         """
         channels = np.arange(n_channels)
-        calibrated_values = (
-            self.offset + channels * self.slope + channels**2 * self.quadratic
+        calibrated_values = np.polynomial.polynomial.polyval(
+            channels, [self.offset, self.slope, self.quadratic]
         )
         return calibrated_values
 
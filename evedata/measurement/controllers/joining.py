@@ -391,28 +391,34 @@ class AxesLastFill(Join):
                 axes_attribute = "data"
             values = getattr(axes_device, axes_attribute)
             if axes[idx][0] in self.measurement.device_snapshots:
-                self.measurement.device_snapshots[axes[idx][0]].get_data()
-                axes_positions = np.searchsorted(
-                    axes_device.position_counts,
-                    self.measurement.device_snapshots[
-                        axes[idx][0]
-                    ].position_counts,
+                snapshot = self.measurement.device_snapshots[axes[idx][0]]
+                snapshot.get_data()
+                insert_indices = np.searchsorted(
+                    axes_device.position_counts, snapshot.position_counts
+                )
+                values = np.insert(
+                    values,
+                    insert_indices,
+                    getattr(snapshot, axes_attribute),
                 )
-                snapshot_values = getattr(
-                    self.measurement.device_snapshots[axes[idx][0]],
-                    axes_attribute,
+                axes_positions = np.insert(
+                    axes_device.position_counts,
+                    insert_indices,
+                    snapshot.position_counts,
                 )
-                values = np.insert(values, axes_positions, snapshot_values)
             else:
                 axes_positions = axes_device.position_counts
             positions = (
-                np.digitize(data_device.position_counts, axes_positions) - 1
+                np.searchsorted(
+                    axes_positions, data_device.position_counts, side="right"
+                )
+                - 1
             )
             values = values[positions]
             # Set values to special value where no previous axis values exist
-            if np.any(np.where(positions < 0)):
-                values = ma.masked_array(values)
-                values[np.where(positions < 0)] = ma.masked
+            missing = positions < 0
+            if np.any(missing):
+                values = ma.masked_array(values, mask=missing, copy=False)
             result.append(values)
         return result
 
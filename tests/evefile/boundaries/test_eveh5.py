@@ -1,5 +1,7 @@
 import functools
 import os
+import shutil
+import tempfile
 import unittest
 
 import h5py
@@ -13,7 +15,7 @@ class DummyHDF5File:
         self.filename = filename
 
     def create(self):
-        with h5py.File(self.filename, "w") as file:
+        with h5py.File(self.filename, "w", libver="latest") as file:
             file.attrs["Version"] = np.bytes_(["0.1.0"])
             file.attrs["Location"] = np.bytes_(["Unittest"])
             c1 = file.create_group("c1")
@@ -22,22 +24,37 @@ class DummyHDF5File:
             main.attrs["name"] = np.bytes_(["foo"])
             meta = c1.create_group("meta")
             meta.attrs["name"] = np.bytes_(["foo"])
-            test = main.create_dataset("test", data=np.ones([5, 2]))
+            test = main.create_dataset(
+                "test", data=np.ones([5, 2]), track_times=False
+            )
             test.attrs["name"] = np.bytes_(["foo"])
-            poscounttimer = meta.create_dataset("PosCountTimer", (1, 1))
+            poscounttimer = meta.create_dataset(
+                "PosCountTimer", (1, 1), track_times=False
+            )
             poscounttimer.attrs["foo"] = np.bytes_(["bar"])
-            scml = file.create_dataset("SCML", (1, 1))
+            scml = file.create_dataset("SCML", (1, 1), track_times=False)
             scml.attrs["foo"] = np.bytes_(["bar"])
 
 
+TMPDIR = ""
+FILENAME = ""
+
+
+def setUpModule():
+    global TMPDIR, FILENAME
+    TMPDIR = tempfile.mkdtemp()
+    FILENAME = os.path.join(TMPDIR, "test.h5")
+    DummyHDF5File(filename=FILENAME).create()
+
+
+def tearDownModule():
+    shutil.rmtree(TMPDIR, ignore_errors=True)
+
+
 class TestHDF5Item(unittest.TestCase):
     def setUp(self):
         self.hdf5_item = eveh5.HDF5Item()
-        self.filename = "test.h5"
-
-    def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        self.filename = FILENAME
 
     def test_instantiate_class(self):
         pass
@@ -68,41 +85,34 @@ class TestHDF5Item(unittest.TestCase):
             self.hdf5_item.get_attributes()
 
     def test_get_attributes_reads_attributes(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_item.filename = self.filename
         self.hdf5_item.name = "/"
         self.hdf5_item.get_attributes()
         self.assertTrue(self.hdf5_item.attributes)
 
     def test_get_attributes_with_iso8859_characters_reads_attributes(self):
-        DummyHDF5File(filename=self.filename).create()
-        with h5py.File(self.filename, "w") as file:
+        filename = os.path.join(TMPDIR, "iso8859.h5")
+        with h5py.File(filename, "w") as file:
             file.attrs["Comment"] = np.bytes_(
                 ["äöü".encode(encoding="iso8859")]
             )
-        self.hdf5_item.filename = self.filename
+        self.hdf5_item.filename = filename
         self.hdf5_item.name = "/"
         self.hdf5_item.get_attributes()
         self.assertTrue(self.hdf5_item.attributes)
 
     def test_attribute_values_are_strings(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_item.filename = self.filename
         self.hdf5_item.name = "/"
         self.hdf5_item.get_attributes()
-        for value in self.hdf5_item.attributes.values():
-            with self.subTest(value=value):
-                self.assertIsInstance(value, str)
+        types = {type(value) for value in self.hdf5_item.attributes.values()}
+        self.assertSetEqual({str}, types)
 
 
 class TestHDF5Dataset(unittest.TestCase):
     def setUp(self):
         self.hdf5_dataset = eveh5.HDF5Dataset()
-        self.filename = "test.h5"
-
-    def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        self.filename = FILENAME
 
     def test_instantiate_class(self):
         pass
@@ -138,18 +148,44 @@ class TestHDF5Dataset(unittest.TestCase):
             self.hdf5_dataset.get_data()
 
     def test_get_data_sets_data(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
         self.hdf5_dataset.get_data()
         self.assertGreater(self.hdf5_dataset.data.size, 0)
 
     def test_accessing_data_sets_data(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
         self.assertGreater(self.hdf5_dataset.data.size, 0)
 
+    def test_get_slice_without_filename_raises(self):
+        with self.assertRaisesRegex(ValueError, "Missing attribute filename"):
+            self.hdf5_dataset.get_slice(np.s_[1:3])
+
+    def test_get_slice_without_name_raises(self):
+        self.hdf5_dataset.filename = "foo"
+        with self.assertRaisesRegex(ValueError, "Missing attribute name"):
+            self.hdf5_dataset.get_slice(np.s_[1:3])
+
+    def test_get_slice_returns_selection(self):
+        self.hdf5_dataset.filename = self.filename
+        self.hdf5_dataset.name = "/c1/main/test"
+        data = self.hdf5_dataset.get_slice(np.s_[1:3, 0])
+        self.assertTupleEqual((2,), data.shape)
+
+    def test_get_slice_does_not_set_data(self):
+        self.hdf5_dataset.filename = self.filename
+        self.hdf5_dataset.name = "/c1/main/test"
+        self.hdf5_dataset.get_slice(np.s_[1:3])
+        self.assertIsNone(self.hdf5_dataset._data)
+
+    def test_get_slice_with_data_set_returns_selection(self):
+        array = np.random.random(5)
+        self.hdf5_dataset.data = array
+        np.testing.assert_array_equal(
+            array[1:3], self.hdf5_dataset.get_slice(np.s_[1:3])
+        )
+
     def test_get_data_does_nothing_if_data_are_set(self):
         array = np.random.random(5)
         self.hdf5_dataset.data = array
@@ -166,14 +202,12 @@ class TestHDF5Dataset(unittest.TestCase):
             _ = self.hdf5_dataset.dtype
 
     def test_dtype_returns_dtype(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
         self.assertIsInstance(self.hdf5_dataset.dtype, np.dtype)
 
     def test_dtype_returns_existing_dtype(self):
         self.hdf5_dataset._dtype = "foo"
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
         self.assertEqual(self.hdf5_dataset.dtype, "foo")
@@ -188,16 +222,14 @@ class TestHDF5Dataset(unittest.TestCase):
             _ = self.hdf5_dataset.shape
 
     def test_shape_returns_shape(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
         self.assertIsInstance(self.hdf5_dataset.shape, tuple)
 
     def test_shape_does_not_load_data(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_dataset.filename = self.filename
         self.hdf5_dataset.name = "/c1/main/test"
-        self.assertTupleEqual((0,), self.hdf5_dataset._data.shape)
+        self.assertIsNone(self.hdf5_dataset._data)
 
 
 class TestHDF5Group(unittest.TestCase):
@@ -260,14 +292,10 @@ class TestHDF5Group(unittest.TestCase):
 class TestHDF5File(unittest.TestCase):
     def setUp(self):
         self.hdf5_file = eveh5.HDF5File()
-        self.filename = "test.h5"
+        self.filename = FILENAME
         self.items = []
         self.items_with_type = {}
 
-    def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
-
     def get_items_from_hdf5_file(self):
         with h5py.File(self.filename, "r") as file:
             file.visit(self.items.append)
@@ -301,12 +329,10 @@ class TestHDF5File(unittest.TestCase):
         self.assertEqual("/", self.hdf5_file.name)
 
     def test_read_sets_filename(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read(self.filename)
         self.assertEqual(self.filename, self.hdf5_file.filename)
 
     def test_read_without_filename_parameter_but_filename_set(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.filename = self.filename
         self.hdf5_file.read()
 
@@ -315,7 +341,6 @@ class TestHDF5File(unittest.TestCase):
             self.hdf5_file.read()
 
     def test_read_adds_items_to_root(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_from_hdf5_file()
         self.hdf5_file.read(self.filename)
         root_items = [x for x in self.items if "/" not in x]
@@ -324,7 +349,6 @@ class TestHDF5File(unittest.TestCase):
                 self.assertTrue(hasattr(self.hdf5_file, item))
 
     def test_read_instantiates_correct_item_type(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_with_type_from_hdf5_file()
         self.hdf5_file.read(self.filename)
         for item, node_type in self.items_with_type.items():
@@ -335,7 +359,6 @@ class TestHDF5File(unittest.TestCase):
                     )
 
     def test_read_sets_item_filename(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_from_hdf5_file()
         self.hdf5_file.read(self.filename)
         root_items = [x for x in self.items if "/" not in x]
@@ -346,7 +369,6 @@ class TestHDF5File(unittest.TestCase):
                 )
 
     def test_read_sets_item_name(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_from_hdf5_file()
         self.hdf5_file.read(self.filename)
         root_items = [x for x in self.items if "/" not in x]
@@ -357,7 +379,6 @@ class TestHDF5File(unittest.TestCase):
                 )
 
     def test_read_adds_item_hierarchy(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_from_hdf5_file()
         self.hdf5_file.read(self.filename)
         for item in self.items:
@@ -365,7 +386,6 @@ class TestHDF5File(unittest.TestCase):
                 functools.reduce(getattr, item.split("/"), self.hdf5_file)
 
     def test_read_with_read_attributes_sets_item_attributes(self):
-        DummyHDF5File(filename=self.filename).create()
         self.get_items_from_hdf5_file()
         self.hdf5_file.read_attributes = True
         self.hdf5_file.read(self.filename)
@@ -378,19 +398,16 @@ class TestHDF5File(unittest.TestCase):
                 )
 
     def test_read_with_read_attributes_sets_file_attributes(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read_attributes = True
         self.hdf5_file.read(self.filename)
         self.assertTrue(self.hdf5_file.attributes)
 
     def test_read_closes_hdf5_file(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read_attributes = True
         self.hdf5_file.read(self.filename)
         self.assertFalse(self.hdf5_file._hdf5_filehandle)
 
     def test_read_with_close_file_false_leaves_hdf5_file_open(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read_attributes = True
         self.hdf5_file.close_file = False
         self.hdf5_file.read(self.filename)
@@ -398,7 +415,6 @@ class TestHDF5File(unittest.TestCase):
         self.hdf5_file._hdf5_filehandle.close()
 
     def test_close_closes_open_hdf5_file(self):
-        DummyHDF5File(filename=self.filename).create()
         self.hdf5_file.read_attributes = True
         self.hdf5_file.close_file = False
         self.hdf5_file.read(self.filename)
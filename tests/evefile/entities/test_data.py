@@ -1,5 +1,7 @@
 import logging
 import os
+import shutil
+import tempfile
 import unittest
 
 import h5py
@@ -7,6 +9,43 @@ import numpy as np
 
 from evedata.evefile.entities import data, metadata
 
+METADATA_TYPES = {
+    data.MonitorData: metadata.MonitorMetadata,
+    data.MeasureData: metadata.MeasureMetadata,
+    data.DeviceData: metadata.DeviceMetadata,
+    data.AxisData: metadata.AxisMetadata,
+    data.ChannelData: metadata.ChannelMetadata,
+    data.TimestampData: metadata.TimestampMetadata,
+    data.NonnumericChannelData: metadata.NonnumericChannelMetadata,
+    data.SinglePointChannelData: metadata.SinglePointChannelMetadata,
+    data.AverageChannelData: metadata.AverageChannelMetadata,
+    data.IntervalChannelData: metadata.IntervalChannelMetadata,
+    data.ArrayChannelData: metadata.ArrayChannelMetadata,
+    data.AreaChannelData: metadata.AreaChannelMetadata,
+    data.NormalizedChannelData: metadata.NormalizedChannelMetadata,
+    data.SinglePointNormalizedChannelData: (
+        metadata.SinglePointNormalizedChannelMetadata
+    ),
+    data.AverageNormalizedChannelData: (
+        metadata.AverageNormalizedChannelMetadata
+    ),
+    data.IntervalNormalizedChannelData: (
+        metadata.IntervalNormalizedChannelMetadata
+    ),
+    data.ScopeChannelData: metadata.ScopeChannelMetadata,
+    data.MCAChannelData: metadata.MCAChannelMetadata,
+    data.ScientificCameraData: metadata.ScientificCameraMetadata,
+    data.SampleCameraData: metadata.SampleCameraMetadata,
+    data.NonencodedAxisData: metadata.NonencodedAxisMetadata,
+    data.SkipData: metadata.SkipMetadata,
+}
+
+
+class AttributeCheckMixin:
+    def assert_has_attributes(self, obj, attributes):
+        missing = [name for name in attributes if not hasattr(obj, name)]
+        self.assertFalse(missing, f"Missing attributes: {missing}")
+
 
 class DummyHDF5File:
     def __init__(self, filename=""):
@@ -67,7 +106,21 @@ class DummyHDF5File:
                 )
 
 
-class TestData(unittest.TestCase):
+class TestMetadataTypes(unittest.TestCase):
+    def test_metadata_are_of_corresponding_type(self):
+        for data_class, metadata_class in METADATA_TYPES.items():
+            with self.subTest(data_class=data_class.__name__):
+                self.assertIsInstance(data_class().metadata, metadata_class)
+
+
+class TestData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "importer",
+    )
+
     def setUp(self):
         self.data = data.Data()
         self.logger = logging.getLogger(name="evedata")
@@ -84,25 +137,17 @@ class TestData(unittest.TestCase):
                 self.get_data_called = True
 
         self.mock_data = MockData()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "importer",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_setting_data_sets_data(self):
         self.data.data = np.random.random(5)
@@ -180,7 +225,14 @@ class TestData(unittest.TestCase):
             self.data.copy_attributes_from()
 
 
-class TestMonitorData(unittest.TestCase):
+class TestMonitorData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "milliseconds",
+    )
+
     def setUp(self):
         self.data = data.MonitorData()
 
@@ -188,24 +240,21 @@ class TestMonitorData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "milliseconds",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.MonitorMetadata)
 
+class TestMeasureData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
 
-class TestMeasureData(unittest.TestCase):
     def setUp(self):
         self.data = data.MeasureData()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
 
         class MockData(data.MeasureData):
 
@@ -220,25 +269,13 @@ class TestMeasureData(unittest.TestCase):
         self.mock_data = MockData()
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.MeasureMetadata)
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_data_sorts_data(self):
         h5file = DummyHDF5File(filename=self.filename)
@@ -254,6 +291,20 @@ class TestMeasureData(unittest.TestCase):
         self.assertTrue(np.all(np.diff(self.data.position_counts) >= 0))
         self.assertFalse(np.all(np.diff(self.data.data) >= 0))
 
+    def test_get_data_sets_contiguous_arrays(self):
+        h5file = DummyHDF5File(filename=self.filename)
+        h5file.create()
+        importer = data.HDF5DataImporter(source=self.filename)
+        importer.item = "/c1/meta/PosCountTimer"
+        importer.mapping = {
+            "PosCounter": "position_counts",
+            "PosCountTimer": "data",
+        }
+        self.data.importer.append(importer)
+        self.data.get_data()
+        self.assertTrue(self.data.position_counts.flags.c_contiguous)
+        self.assertTrue(self.data.data.flags.c_contiguous)
+
     def test_setting_positions_sets_positions(self):
         self.data.position_counts = np.random.random(5)
         self.assertGreater(len(self.data.position_counts), 0)
@@ -268,7 +319,14 @@ class TestMeasureData(unittest.TestCase):
         self.assertFalse(self.mock_data.get_data_called)
 
 
-class TestDeviceData(unittest.TestCase):
+class TestDeviceData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.DeviceData()
 
@@ -276,46 +334,31 @@ class TestDeviceData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.DeviceMetadata)
 
+class TestAxisData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "set_values",
+    )
 
-class TestAxisData(unittest.TestCase):
     def setUp(self):
         self.data = data.AxisData()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "set_values",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.AxisMetadata)
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_data_takes_last_from_duplicate_pos_counts(self):
         h5file = DummyHDF5File(filename=self.filename)
@@ -359,31 +402,27 @@ class TestAxisData(unittest.TestCase):
         self.assertEqual(h5file.shape, len(self.data.data))
 
 
-class TestChannelData(unittest.TestCase):
+class TestChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.ChannelData()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.ChannelMetadata)
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_data_takes_first_from_duplicate_pos_counts(self):
         h5file = DummyHDF5File(filename=self.filename)
@@ -413,7 +452,14 @@ class TestChannelData(unittest.TestCase):
         self.assertEqual(h5file.shape, len(self.data.data))
 
 
-class TestTimestampData(unittest.TestCase):
+class TestTimestampData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.TimestampData()
 
@@ -421,18 +467,7 @@ class TestTimestampData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.TimestampMetadata)
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_position_returns_position(self):
         self.data.position_counts = np.linspace(start=4, stop=23, num=20)
@@ -465,7 +500,14 @@ class TestTimestampData(unittest.TestCase):
         )
 
 
-class TestNonnumericChannelData(unittest.TestCase):
+class TestNonnumericChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.NonnumericChannelData()
 
@@ -473,23 +515,17 @@ class TestNonnumericChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.NonnumericChannelMetadata
-        )
 
+class TestSinglePointChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
 
-class TestSinglePointChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.SinglePointChannelData()
 
@@ -497,23 +533,19 @@ class TestSinglePointChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.SinglePointChannelMetadata
-        )
 
+class TestAverageChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "raw_data",
+        "attempts",
+    )
 
-class TestAverageChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.AverageChannelData()
 
@@ -521,22 +553,7 @@ class TestAverageChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "raw_data",
-            "attempts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.AverageChannelMetadata
-        )
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_mean_returns_mean_values(self):
         self.data.raw_data = np.asarray([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
@@ -556,7 +573,16 @@ class TestAverageChannelData(unittest.TestCase):
         )
 
 
-class TestIntervalChannelData(unittest.TestCase):
+class TestIntervalChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "raw_data",
+        "counts",
+    )
+
     def setUp(self):
         self.data = data.IntervalChannelData()
 
@@ -564,22 +590,7 @@ class TestIntervalChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "raw_data",
-            "counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.IntervalChannelMetadata
-        )
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_mean_returns_mean_values(self):
         self.data.raw_data = np.asarray([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
@@ -599,33 +610,27 @@ class TestIntervalChannelData(unittest.TestCase):
         )
 
 
-class TestArrayChannelData(unittest.TestCase):
+class TestArrayChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.ArrayChannelData()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.ArrayChannelMetadata
-        )
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_data_loads_data(self):
         h5file = DummyHDF5File(filename=self.filename)
@@ -642,7 +647,14 @@ class TestArrayChannelData(unittest.TestCase):
         self.assertEqual(2, self.data.data.ndim)
 
 
-class TestAreaChannelData(unittest.TestCase):
+class TestAreaChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.AreaChannelData()
 
@@ -650,23 +662,15 @@ class TestAreaChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.AreaChannelMetadata
-        )
 
+class TestNormalizedChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "normalized_data",
+        "normalizing_data",
+    )
 
-class TestNormalizedChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.NormalizedChannelData()
 
@@ -674,21 +678,21 @@ class TestNormalizedChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "normalized_data",
-            "normalizing_data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.NormalizedChannelMetadata
-        )
 
+class TestSinglePointNormalizedChannelData(
+    AttributeCheckMixin, unittest.TestCase
+):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "normalized_data",
+        "normalizing_data",
+    )
 
-class TestSinglePointNormalizedChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.SinglePointNormalizedChannelData()
 
@@ -696,25 +700,23 @@ class TestSinglePointNormalizedChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "normalized_data",
-            "normalizing_data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestAverageNormalizedChannelData(
+    AttributeCheckMixin, unittest.TestCase
+):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "raw_data",
+        "attempts",
+        "normalized_data",
+        "normalizing_data",
+    )
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.SinglePointNormalizedChannelMetadata
-        )
-
-
-class TestAverageNormalizedChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.AverageNormalizedChannelData()
 
@@ -722,27 +724,23 @@ class TestAverageNormalizedChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "raw_data",
-            "attempts",
-            "normalized_data",
-            "normalizing_data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.AverageNormalizedChannelMetadata
-        )
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestIntervalNormalizedChannelData(
+    AttributeCheckMixin, unittest.TestCase
+):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "raw_data",
+        "counts",
+        "normalized_data",
+        "normalizing_data",
+    )
 
-
-class TestIntervalNormalizedChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.IntervalNormalizedChannelData()
 
@@ -750,27 +748,17 @@ class TestIntervalNormalizedChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "raw_data",
-            "counts",
-            "normalized_data",
-            "normalizing_data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.IntervalNormalizedChannelMetadata
-        )
 
+class TestScopeChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
 
-class TestScopeChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.ScopeChannelData()
 
@@ -778,23 +766,22 @@ class TestScopeChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestMCAChannelData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "roi",
+        "life_time",
+        "real_time",
+        "preset_life_time",
+        "preset_real_time",
+    )
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.ScopeChannelMetadata
-        )
-
-
-class TestMCAChannelData(unittest.TestCase):
     def setUp(self):
         self.data = data.MCAChannelData()
 
@@ -802,26 +789,19 @@ class TestMCAChannelData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "roi",
-            "life_time",
-            "real_time",
-            "preset_life_time",
-            "preset_real_time",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.MCAChannelMetadata)
 
+class TestMCAChannelROIData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "label",
+        "marker",
+    )
 
-class TestMCAChannelROIData(unittest.TestCase):
     def setUp(self):
         self.data = data.MCAChannelROIData()
 
@@ -829,20 +809,22 @@ class TestMCAChannelROIData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "label",
-            "marker",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-
-class TestScientificCameraData(unittest.TestCase):
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestScientificCameraData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "roi",
+        "statistics",
+        "acquire_time",
+        "temperature",
+        "humidity",
+    )
+
     def setUp(self):
         self.data = data.ScientificCameraData()
 
@@ -850,28 +832,19 @@ class TestScientificCameraData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "roi",
-            "statistics",
-            "acquire_time",
-            "temperature",
-            "humidity",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.ScientificCameraMetadata
-        )
 
+class TestScientificCameraROIData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "label",
+        "marker",
+    )
 
-class TestScientificCameraROIData(unittest.TestCase):
     def setUp(self):
         self.data = data.ScientificCameraROIData()
 
@@ -879,20 +852,35 @@ class TestScientificCameraROIData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "label",
-            "marker",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-
-class TestScientificCameraStatisticsData(unittest.TestCase):
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestScientificCameraStatisticsData(
+    AttributeCheckMixin, unittest.TestCase
+):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "background_width",
+        "min_value",
+        "min_x",
+        "min_y",
+        "max_value",
+        "max_x",
+        "max_y",
+        "mean",
+        "total",
+        "net",
+        "sigma",
+        "centroid_x",
+        "centroid_y",
+        "centroid_sigma_x",
+        "centroid_sigma_y",
+        "centroid_sigma_xy",
+    )
+
     def setUp(self):
         self.data = data.ScientificCameraStatisticsData()
 
@@ -900,34 +888,17 @@ class TestScientificCameraStatisticsData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "background_width",
-            "min_value",
-            "min_x",
-            "min_y",
-            "max_value",
-            "max_x",
-            "max_y",
-            "mean",
-            "total",
-            "net",
-            "sigma",
-            "centroid_x",
-            "centroid_y",
-            "centroid_sigma_x",
-            "centroid_sigma_y",
-            "centroid_sigma_xy",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-
-class TestSampleCameraData(unittest.TestCase):
+        self.assert_has_attributes(self.data, self.expected_attributes)
+
+
+class TestSampleCameraData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.SampleCameraData()
 
@@ -935,23 +906,19 @@ class TestSampleCameraData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.SampleCameraMetadata
-        )
 
+class TestNonencodedAxisData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+        "set_values",
+        "filled_data",
+    )
 
-class TestNonencodedAxisData(unittest.TestCase):
     def setUp(self):
         self.data = data.NonencodedAxisData()
 
@@ -959,25 +926,15 @@ class TestNonencodedAxisData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-            "set_values",
-            "filled_data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(
-            self.data.metadata, metadata.NonencodedAxisMetadata
-        )
 
+class TestDataImporter(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "source",
+        "preprocessing",
+    )
 
-class TestDataImporter(unittest.TestCase):
     def setUp(self):
         self.importer = data.DataImporter()
 
@@ -985,13 +942,7 @@ class TestDataImporter(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "source",
-            "preprocessing",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.importer, attribute))
+        self.assert_has_attributes(self.importer, self.expected_attributes)
 
     def test_load_without_source_raises(self):
         self.importer.source = ""
@@ -1033,35 +984,35 @@ class TestDataImporter(unittest.TestCase):
         self.assertEqual(importer.source * 2, importer.load())
 
 
-class TestHDF5DataImporter(unittest.TestCase):
+class TestHDF5DataImporter(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "source",
+        "item",
+        "mapping",
+        "data",
+    )
+
     def setUp(self):
         self.importer = data.HDF5DataImporter()
-        self.filename = "test.h5"
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.h5")
         self.item = "/c1/main/test"
+        self.dataset = np.ones(1, dtype=np.float32)
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
 
     def create_hdf5_file(self):
         with h5py.File(self.filename, "w") as file:
             c1 = file.create_group("c1")
             main = c1.create_group("main")
-            main.create_dataset("test", data=np.ones([5, 2]))
+            main.create_dataset("test", data=self.dataset)
 
     def test_instantiate_class(self):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "source",
-            "item",
-            "mapping",
-            "data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.importer, attribute))
+        self.assert_has_attributes(self.importer, self.expected_attributes)
 
     def test_load_without_item_raises(self):
         self.importer.source = "foo"
@@ -1077,14 +1028,14 @@ class TestHDF5DataImporter(unittest.TestCase):
         self.create_hdf5_file()
         self.importer.source = self.filename
         self.importer.item = self.item
-        np.testing.assert_array_equal(np.ones([5, 2]), self.importer.load())
+        np.testing.assert_array_equal(self.dataset, self.importer.load())
 
     def test_load_sets_data_attribute(self):
         self.create_hdf5_file()
         self.importer.source = self.filename
         self.importer.item = self.item
         self.importer.load()
-        np.testing.assert_array_equal(np.ones([5, 2]), self.importer.data)
+        np.testing.assert_array_equal(self.dataset, self.importer.data)
 
     def test_load_performs_preprocessing_data(self):
         self.create_hdf5_file()
@@ -1097,10 +1048,17 @@ class TestHDF5DataImporter(unittest.TestCase):
         self.importer.source = self.filename
         self.importer.item = self.item
         self.importer.load()
-        np.testing.assert_array_equal(self.importer.data, np.ones([5, 2]) * 2)
+        np.testing.assert_array_equal(self.importer.data, self.dataset * 2)
 
 
-class TestSkipData(unittest.TestCase):
+class TestSkipData(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = (
+        "metadata",
+        "options",
+        "data",
+        "position_counts",
+    )
+
     def setUp(self):
         self.data = data.SkipData()
 
@@ -1108,18 +1066,7 @@ class TestSkipData(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "metadata",
-            "options",
-            "data",
-            "position_counts",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.data, attribute))
-
-    def test_metadata_are_of_corresponding_type(self):
-        self.assertIsInstance(self.data.metadata, metadata.SkipMetadata)
+        self.assert_has_attributes(self.data, self.expected_attributes)
 
     def test_get_parent_positions(self):
         self.data.position_counts = np.asarray(
@@ -1151,7 +1098,9 @@ class TestSkipData(unittest.TestCase):
         )
 
 
-class TestImporterPreprocessingStep(unittest.TestCase):
+class TestImporterPreprocessingStep(AttributeCheckMixin, unittest.TestCase):
+    expected_attributes = ("data",)
+
     def setUp(self):
         self.preprocessing = data.ImporterPreprocessingStep()
 
@@ -1159,12 +1108,9 @@ class TestImporterPreprocessingStep(unittest.TestCase):
         pass
 
     def test_has_attributes(self):
-        attributes = [
-            "data",
-        ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.preprocessing, attribute))
+        self.assert_has_attributes(
+            self.preprocessing, self.expected_attributes
+        )
 
     def test_process_with_data_sets_data(self):
         self.preprocessing.process(data="foo")
@@ -1,10 +1,12 @@
-import contextlib
 import datetime
 import unittest
-from io import StringIO
 
 from evedata.evefile.entities import file, data
 
+LOG_MESSAGE = "2024-07-25T10:04:03: Lorem ipsum"
+LOG_MESSAGE_TIMESTAMP = datetime.datetime.fromisoformat("2024-07-25T10:04:03")
+LOG_MESSAGE_TEXT = "Lorem ipsum"
+
 
 class TestFile(unittest.TestCase):
     def setUp(self):
@@ -55,15 +57,13 @@ class TestMetadata(unittest.TestCase):
                 self.assertTrue(hasattr(self.metadata, attribute))
 
     def test_print_prints_attribute_names(self):
-        temp_stdout = StringIO()
-        with contextlib.redirect_stdout(temp_stdout):
-            print(self.metadata)
-        output = temp_stdout.getvalue().strip()
-        attributes = [
-            item for item in dir(self.metadata) if not item.startswith("_")
-        ]
-        for attribute in attributes:
-            self.assertIn(attribute, output)
+        output = str(self.metadata).strip()
+        attributes = set(vars(self.metadata))
+        names = {
+            line.split(":", maxsplit=1)[0].strip()
+            for line in output.splitlines()
+        }
+        self.assertLessEqual(attributes, names)
 
 
 class TestScan(unittest.TestCase):
@@ -98,23 +98,14 @@ class TestLogMessage(unittest.TestCase):
                 self.assertTrue(hasattr(self.log_message, attribute))
 
     def test_from_string_sets_timestamp_and_message(self):
-        string = "2024-07-25T10:04:03: Lorem ipsum"
-        self.log_message.from_string(string)
-        timestamp, message = string.split(": ", maxsplit=1)
-        self.assertEqual(
-            datetime.datetime.fromisoformat(timestamp),
-            self.log_message.timestamp,
-        )
-        self.assertEqual(message, self.log_message.message)
+        self.log_message.from_string(LOG_MESSAGE)
+        self.assertEqual(LOG_MESSAGE_TIMESTAMP, self.log_message.timestamp)
+        self.assertEqual(LOG_MESSAGE_TEXT, self.log_message.message)
 
     def test_print_prints_log_message(self):
-        string = "2024-07-25T10:04:03: Lorem ipsum"
-        self.log_message.from_string(string)
-        temp_stdout = StringIO()
-        with contextlib.redirect_stdout(temp_stdout):
-            print(self.log_message)
-        output = temp_stdout.getvalue().strip()
-        self.assertEqual(string, output)
+        self.log_message.from_string(LOG_MESSAGE)
+        output = str(self.log_message).strip()
+        self.assertEqual(LOG_MESSAGE, output)
 
 
 class TestScanModule(unittest.TestCase):
@@ -139,10 +130,21 @@ class TestScanModule(unittest.TestCase):
             with self.subTest(attribute=attribute):
                 self.assertTrue(hasattr(self.scan_module, attribute))
 
+    @staticmethod
+    def _make_device_data(name):
+        device_data = data.MeasureData()
+        device_data.metadata.name = name
+        return device_data
+
     def test_device_names_returns_list_of_device_names(self):
-        devices = {"foo": "foo:id", "bar": "bar:id"}
-        for name, device_id in devices.items():
-            device_data = data.MeasureData()
-            device_data.metadata.name = name
-            self.scan_module.data[device_id] = device_data
-        self.assertDictEqual(devices, self.scan_module.device_names)
+        for devices in [
+            {},
+            {"foo": "foo:id"},
+            {"foo": "foo:id", "bar": "bar:id"},
+        ]:
+            with self.subTest(devices=devices):
+                self.scan_module.data = {
+                    device_id: self._make_device_data(name)
+                    for name, device_id in devices.items()
+                }
+                self.assertDictEqual(devices, self.scan_module.device_names)
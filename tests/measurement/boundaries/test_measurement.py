@@ -1,5 +1,8 @@
+import copy
 import os
+import shutil
 import struct
+import tempfile
 import unittest
 import zlib
 
@@ -10,7 +13,6 @@ import evedata.evefile.entities.data
 from evedata.measurement.boundaries import measurement
 from evedata.measurement.controllers import joining
 
-
 SCML = """<?xml version="1.0" encoding="UTF-8"?>
 <tns:scml xsi:schemaLocation="http://www.ptb.de/epics/SCML scml.xsd"
     xmlns:tns="http://www.ptb.de/epics/SCML" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
@@ -72,6 +74,91 @@ SCML = """<?xml version="1.0" encoding="UTF-8"?>
     <motors/>
     <devices/>
 </tns:scml>"""
+COMPRESSED_SCML = zlib.compress(bytes(SCML, "utf8"))
+SCML_HEADER = (
+    b"EVEcSCML"
+    + struct.pack("!L", len(COMPRESSED_SCML))
+    + struct.pack("!L", len(SCML))
+    + COMPRESSED_SCML
+)
+SCML_OFFSET = 2 ** max(9, (len(SCML_HEADER) - 1).bit_length())
+
+
+ROOT_ATTRIBUTES = {
+    "EVEH5Version": np.bytes_(["7"]),
+    "Version": np.bytes_(["2.0"]),
+    "XMLversion": np.bytes_(["9.2"]),
+    "Comment": np.bytes_([""]),
+    "Location": np.bytes_(["Unittest"]),
+    "StartTimeISO": np.bytes_(["2024-06-03T12:01:32"]),
+    "EndTimeISO": np.bytes_(["2024-06-03T12:01:37"]),
+    "Simulation": np.bytes_(["no"]),
+}
+PREFERRED_ATTRIBUTES = {
+    "preferredAxis": np.bytes_(["SimMot:01"]),
+    "preferredChannel": np.bytes_(["SimChan:01"]),
+}
+DEVICE_ATTRIBUTES = {
+    "SimMot:01": {
+        "Name": np.bytes_(["foo"]),
+        "Unit": np.bytes_(["eV"]),
+        "Access": np.bytes_(["ca:foobar"]),
+        "DeviceType": np.bytes_(["Axis"]),
+    },
+    "SimMot:02": {
+        "Name": np.bytes_(["baf"]),
+        "Unit": np.bytes_(["nm"]),
+        "Access": np.bytes_(["ca:foobaz"]),
+        "DeviceType": np.bytes_(["Axis"]),
+    },
+    "SimChan:01": {
+        "Name": np.bytes_(["bar"]),
+        "Unit": np.bytes_(["A"]),
+        "Access": np.bytes_(["ca:barbaz"]),
+        "DeviceType": np.bytes_(["Channel"]),
+        "Detectortype": np.bytes_(["Standard"]),
+    },
+    "SimChan:02": {
+        "Name": np.bytes_(["baz"]),
+        "Unit": np.bytes_(["mA"]),
+        "Access": np.bytes_(["ca:bazfoo"]),
+        "DeviceType": np.bytes_(["Channel"]),
+        "Detectortype": np.bytes_(["Standard"]),
+    },
+    "SimChan:03": {
+        "Name": np.bytes_(["bazfoo"]),
+        "Unit": np.bytes_(["A"]),
+        "Access": np.bytes_(["ca:bazfoo"]),
+        "DeviceType": np.bytes_(["Channel"]),
+        "Detectortype": np.bytes_(["Standard"]),
+    },
+    "PosCountTimer": {
+        "Unit": np.bytes_(["msecs"]),
+    },
+}
+MAIN_DATASETS = {
+    "SimMot:01": np.arange(1, 6, dtype="<i4"),
+    "SimMot:02": np.arange(2, 9, dtype="<i4"),
+    "SimChan:01": np.arange(1, 6, dtype="<i4"),
+    "SimChan:02": np.arange(2, 9, dtype="<i4"),
+}
+SNAPSHOT_DATASETS = {
+    "SimMot:01": np.asarray([1, 9], dtype="<i4"),
+    "SimChan:01": np.asarray([1, 9], dtype="<i4"),
+    "SimChan:03": np.asarray([1, 9], dtype="<i4"),
+}
+POS_COUNT_TIMER = np.empty(
+    8, dtype=[("PosCounter", "<i4"), ("PosCountTimer", "<i4")]
+)
+POS_COUNT_TIMER["PosCounter"] = np.arange(1, 9, dtype="<i4")
+POS_COUNT_TIMER["PosCountTimer"] = np.arange(42, 827, 112, dtype="<i4")
+LOG_MESSAGES = np.asarray(
+    [
+        b"2024-07-25T10:04:03: Lorem ipsum",
+        b"2024-07-25T10:05:23: dolor sit amet",
+    ]
+)
+RNG = np.random.default_rng(seed=0)
 
 
 class DummyHDF5File:
@@ -79,176 +166,100 @@ class DummyHDF5File:
         self.filename = filename
 
     def create(self, set_preferred=True, add_snapshot=False, scml=True):
-        with h5py.File(self.filename, "w") as file:
-            file.attrs["EVEH5Version"] = np.bytes_(["7"])
-            file.attrs["Version"] = np.bytes_(["2.0"])
-            file.attrs["XMLversion"] = np.bytes_(["9.2"])
-            file.attrs["Comment"] = np.bytes_([""])
-            file.attrs["Location"] = np.bytes_(["Unittest"])
-            file.attrs["StartTimeISO"] = np.bytes_(["2024-06-03T12:01:32"])
-            file.attrs["EndTimeISO"] = np.bytes_(["2024-06-03T12:01:37"])
-            file.attrs["Simulation"] = np.bytes_(["no"])
+        userblock_size = SCML_OFFSET if scml else 0
+        with h5py.File(
+            self.filename,
+            "w",
+            libver="latest",
+            userblock_size=userblock_size,
+        ) as file:
+            file.attrs.update(ROOT_ATTRIBUTES)
             c1 = file.create_group("c1")
             if set_preferred:
-                c1.attrs["preferredAxis"] = np.bytes_(["SimMot:01"])
-                c1.attrs["preferredChannel"] = np.bytes_(["SimChan:01"])
+                c1.attrs.update(PREFERRED_ATTRIBUTES)
             main = c1.create_group("main")
             meta = c1.create_group("meta")
             snapshot = c1.create_group("snapshot")
-            simmot = main.create_dataset(
-                "SimMot:01",
-                data=np.ndarray(
-                    [5],
-                    dtype=np.dtype(
-                        [("PosCounter", "<i4"), ("SimMot:01", "<f8")]
-                    ),
-                ),
-            )
-            simmot["PosCounter"] = np.linspace(1, 5, 5)
-            simmot["SimMot:01"] = np.random.random(5)
-            simmot.attrs["Name"] = np.bytes_(["foo"])
-            simmot.attrs["Unit"] = np.bytes_(["eV"])
-            simmot.attrs["Access"] = np.bytes_(["ca:foobar"])
-            simmot.attrs["DeviceType"] = np.bytes_(["Axis"])
-            simmot2 = main.create_dataset(
-                "SimMot:02",
-                data=np.ndarray(
-                    [7],
-                    dtype=np.dtype(
-                        [("PosCounter", "<i4"), ("SimMot:02", "<f8")]
-                    ),
-                ),
-            )
-            simmot2["PosCounter"] = np.linspace(2, 8, 7)
-            simmot2["SimMot:02"] = np.random.random(7)
-            simmot2.attrs["Name"] = np.bytes_(["baf"])
-            simmot2.attrs["Unit"] = np.bytes_(["nm"])
-            simmot2.attrs["Access"] = np.bytes_(["ca:foobaz"])
-            simmot2.attrs["DeviceType"] = np.bytes_(["Axis"])
-            simchan = main.create_dataset(
-                "SimChan:01",
-                data=np.ndarray(
-                    [5],
-                    dtype=np.dtype(
-                        [("PosCounter", "<i4"), ("SimChan:01", "<f8")]
-                    ),
-                ),
-            )
-            simchan["PosCounter"] = np.linspace(1, 5, 5)
-            simchan["SimChan:01"] = np.random.random(5)
-            simchan.attrs["Name"] = np.bytes_(["bar"])
-            simchan.attrs["Unit"] = np.bytes_(["A"])
-            simchan.attrs["Access"] = np.bytes_(["ca:barbaz"])
-            simchan.attrs["DeviceType"] = np.bytes_(["Channel"])
-            simchan.attrs["Detectortype"] = np.bytes_(["Standard"])
-            simchan2 = main.create_dataset(
-                "SimChan:02",
-                data=np.ndarray(
-                    [7],
-                    dtype=np.dtype(
-                        [("PosCounter", "<i4"), ("SimChan:02", "<f8")]
-                    ),
-                ),
+            self._create_datasets(main, MAIN_DATASETS)
+            poscounttimer = meta.create_dataset(
+                "PosCountTimer", data=POS_COUNT_TIMER, track_times=False
             )
-            simchan2["PosCounter"] = np.linspace(2, 8, 7)
-            simchan2["SimChan:02"] = np.random.random(7)
-            simchan2.attrs["Name"] = np.bytes_(["baz"])
-            simchan2.attrs["Unit"] = np.bytes_(["mA"])
-            simchan2.attrs["Access"] = np.bytes_(["ca:bazfoo"])
-            simchan2.attrs["DeviceType"] = np.bytes_(["Channel"])
-            simchan2.attrs["Detectortype"] = np.bytes_(["Standard"])
-            data = np.ndarray(
-                [8],
-                dtype=np.dtype(
-                    [("PosCounter", "<i4"), ("PosCountTimer", "<i4")]
-                ),
+            poscounttimer.attrs.update(DEVICE_ATTRIBUTES["PosCountTimer"])
+            file.create_dataset(
+                "LiveComment", data=LOG_MESSAGES, track_times=False
             )
-            data["PosCounter"] = np.linspace(1, 8, 8)
-            data["PosCountTimer"] = np.linspace(42, 826, 8)
-            poscounttimer = meta.create_dataset("PosCountTimer", data=data)
-            poscounttimer.attrs["Unit"] = np.bytes_(["msecs"])
-
-            log_messages = [
-                b"2024-07-25T10:04:03: Lorem ipsum",
-                b"2024-07-25T10:05:23: dolor sit amet",
-            ]
-            file.create_dataset("LiveComment", data=np.asarray(log_messages))
             if add_snapshot:
-                simmot = snapshot.create_dataset(
-                    "SimMot:01",
-                    data=np.ndarray(
-                        [2],
-                        dtype=np.dtype(
-                            [("PosCounter", "<i4"), ("SimMot:01", "<f8")]
-                        ),
-                    ),
-                )
-                simmot["PosCounter"] = np.asarray([1, 9])
-                simmot["SimMot:01"] = np.random.random(2)
-                simmot.attrs["Name"] = np.bytes_(["foo"])
-                simmot.attrs["Unit"] = np.bytes_(["eV"])
-                simmot.attrs["Access"] = np.bytes_(["ca:foobar"])
-                simmot.attrs["DeviceType"] = np.bytes_(["Axis"])
-                simchan = snapshot.create_dataset(
-                    "SimChan:01",
-                    data=np.ndarray(
-                        [2],
-                        dtype=np.dtype(
-                            [("PosCounter", "<i4"), ("SimChan:01", "<f8")]
-                        ),
-                    ),
-                )
-                simchan["PosCounter"] = np.asarray([1, 9])
-                simchan["SimChan:01"] = np.random.random(2)
-                simchan.attrs["Name"] = np.bytes_(["bar"])
-                simchan.attrs["Unit"] = np.bytes_(["A"])
-                simchan.attrs["Access"] = np.bytes_(["ca:barbaz"])
-                simchan.attrs["DeviceType"] = np.bytes_(["Channel"])
-                simchan.attrs["Detectortype"] = np.bytes_(["Standard"])
-                simchan3 = snapshot.create_dataset(
-                    "SimChan:03",
-                    data=np.ndarray(
-                        [2],
-                        dtype=np.dtype(
-                            [("PosCounter", "<i4"), ("SimChan:03", "<f8")]
-                        ),
-                    ),
-                )
-                simchan3["PosCounter"] = np.asarray([1, 9])
-                simchan3["SimChan:03"] = np.random.random(2)
-                simchan3.attrs["Name"] = np.bytes_(["bazfoo"])
-                simchan3.attrs["Unit"] = np.bytes_(["A"])
-                simchan3.attrs["Access"] = np.bytes_(["ca:bazfoo"])
-                simchan3.attrs["DeviceType"] = np.bytes_(["Channel"])
-                simchan3.attrs["Detectortype"] = np.bytes_(["Standard"])
+                self._create_datasets(snapshot, SNAPSHOT_DATASETS)
         if scml:
             self.add_scml()
 
+    @staticmethod
+    def _create_datasets(group, datasets):
+        for name, positions in datasets.items():
+            data = np.empty(
+                len(positions), dtype=[("PosCounter", "<i4"), (name, "<f8")]
+            )
+            data["PosCounter"] = positions
+            data[name] = RNG.random(len(positions))
+            dataset = group.create_dataset(name, data=data, track_times=False)
+            dataset.attrs.update(DEVICE_ATTRIBUTES[name])
+
     def add_scml(self):
-        with open(self.filename, "rb") as file:
-            hdf5_contents = file.read()
-        with open(self.filename, "wb") as file:
-            file.write(b"EVEcSCML")
-            compressed_scml = zlib.compress(bytes(SCML, "utf8"))
-            file.write(struct.pack("!L", len(compressed_scml)))
-            file.write(struct.pack("!L", len(SCML)))
-            file.write(compressed_scml)
-            offset = 512
-            if len(compressed_scml) > offset:
-                offset = 2 ** (len(compressed_scml) - 1).bit_length()
-            file.write(bytearray(offset - len(compressed_scml) - 16))
-            file.write(hdf5_contents)
+        with open(self.filename, "r+b") as file:
+            file.write(SCML_HEADER)
+
+
+TEMPLATE_OPTIONS = {
+    "default": {},
+    "noscml": {"scml": False},
+    "nopref": {"set_preferred": False},
+    "nopref_noscml": {"set_preferred": False, "scml": False},
+    "snapshot": {"add_snapshot": True},
+}
+TMPDIR = ""
+TEMPLATES = {}
+
+
+def setUpModule():
+    global TMPDIR
+    TMPDIR = tempfile.mkdtemp()
+    for name, options in TEMPLATE_OPTIONS.items():
+        TEMPLATES[name] = os.path.join(TMPDIR, f"{name}.h5")
+        DummyHDF5File(filename=TEMPLATES[name]).create(**options)
+
+
+def tearDownModule():
+    shutil.rmtree(TMPDIR, ignore_errors=True)
 
 
 class TestMeasurement(unittest.TestCase):
+    loaded = ("noscml",)
+
+    @classmethod
+    def setUpClass(cls):
+        cls._loaded = {}
+        for name in cls.loaded:
+            cls._loaded[name] = measurement.Measurement()
+            cls._loaded[name].load(filename=TEMPLATES[name])
+
     def setUp(self):
         self.measurement = measurement.Measurement()
-        self.filename = "file.h5"
+        self.filename = os.path.join(TMPDIR, "file.h5")
 
     def tearDown(self):
         if os.path.exists(self.filename):
             os.remove(self.filename)
 
+    def _use_template(self, name):
+        shutil.copyfile(TEMPLATES[name], self.filename)
+
+    def _prepare(self, name):
+        self._use_template(name)
+        self.measurement.load(filename=self.filename)
+
+    def _use_loaded(self, name):
+        self.measurement = copy.deepcopy(self._loaded[name])
+
     def test_instantiate_class(self):
         pass
 
@@ -264,55 +275,51 @@ class TestMeasurement(unittest.TestCase):
             "log_messages",
             "data",
         ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.measurement, attribute))
+        missing = [
+            attribute
+            for attribute in attributes
+            if not hasattr(self.measurement, attribute)
+        ]
+        self.assertFalse(missing, f"Missing attributes: {missing}")
 
     def test_setting_filename_sets_metadata_filename(self):
         self.measurement.filename = self.filename
         self.assertEqual(self.measurement.metadata.filename, self.filename)
 
     def test_load_with_filename_sets_metadata_filename(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
-        self.measurement.load(filename=self.filename)
+        self._prepare("default")
         self.assertEqual(self.filename, self.measurement.metadata.filename)
 
     def test_load_without_filename_but_filename_set_keeps_filename(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
+        self._use_template("default")
         self.measurement.filename = self.filename
         self.measurement.load()
         self.assertEqual(self.filename, self.measurement.metadata.filename)
 
     def test_load_sets_file_metadata(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
-        self.measurement.load(filename=self.filename)
+        self._prepare("default")
         root_mappings = {
             "eveh5_version": "7",
             "measurement_station": "Unittest",
         }
-        for key, value in root_mappings.items():
-            with self.subTest(key=key, val=value):
-                self.assertEqual(
-                    getattr(self.measurement.metadata, key), value
-                )
+        self.assertDictEqual(
+            root_mappings,
+            {
+                key: getattr(self.measurement.metadata, key)
+                for key in root_mappings
+            },
+        )
 
     def test_init_with_filename_sets_metadata_filename(self):
         file = measurement.Measurement(filename=self.filename)
         self.assertEqual(self.filename, file.metadata.filename)
 
     def test_load_sets_log_messages(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
-        self.measurement.load(filename=self.filename)
+        self._prepare("default")
         self.assertTrue(self.measurement.log_messages)
 
     def test_load_sets_scan_modules(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
-        self.measurement.load(filename=self.filename)
+        self._prepare("default")
         self.assertTrue(self.measurement.scan_modules)
         for item in self.measurement.scan_modules.values():
             self.assertIsInstance(
@@ -320,9 +327,7 @@ class TestMeasurement(unittest.TestCase):
             )
 
     def test_load_sets_device_snapshots(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(add_snapshot=True)
-        self.measurement.load(filename=self.filename)
+        self._prepare("snapshot")
         self.assertTrue(self.measurement.device_snapshots)
         for item in self.measurement.device_snapshots.values():
             self.assertIsInstance(
@@ -330,9 +335,7 @@ class TestMeasurement(unittest.TestCase):
             )
 
     def test_load_sets_data_to_preferred_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._prepare("noscml")
         np.testing.assert_array_equal(
             self.measurement.data.data,
             self.measurement.scan_modules["main"].data["SimChan:01"].data,
@@ -343,16 +346,12 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_load_does_not_set_data_if_no_preferred_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(set_preferred=False)
-        self.measurement.load(filename=self.filename)
+        self._prepare("nopref")
         self.assertEqual(0, len(self.measurement.data.data))
         self.assertEqual(0, len(self.measurement.data.axes[0].values))
 
     def test_load_with_preferred_data_sets_axis_metadata(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._prepare("noscml")
         self.assertEqual(
             self.measurement.scan_modules["main"]
             .data[self.measurement.metadata.preferred_axis]
@@ -379,28 +378,20 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_load_maps_scan(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create()
-        self.measurement.load(filename=self.filename)
+        self._prepare("default")
         self.assertTrue(self.measurement.scan)
         self.assertTrue("9.2", self.measurement.scan.version)
 
     def test_preferred_data_sets_current_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         self.assertEqual("SimChan:01", self.measurement.current_data)
 
     def test_preferred_data_sets_current_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         self.assertListEqual(["SimMot:01"], self.measurement.current_axes)
 
     def test_set_data_sets_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimChan:02"
         self.measurement.set_data(name=name)
         np.testing.assert_array_equal(
@@ -409,9 +400,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_data_sets_current_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimChan:02"
         self.measurement.set_data(name=name)
         self.assertEqual(name, self.measurement.current_data)
@@ -421,27 +410,21 @@ class TestMeasurement(unittest.TestCase):
             self.measurement.current_data = "foo"  # noqa
 
     def test_get_current_data_returns_tuple(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         self.assertEqual(
             (self.measurement.current_data, "data"),
             self.measurement.get_current_data(),
         )
 
     def test_get_current_axes_returns_list_of_tuples(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         self.assertListEqual(
             [(self.measurement.current_axes[0], "data")],
             self.measurement.get_current_axes(),
         )
 
     def test_set_data_sets_axis_metadata(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimChan:02"
         self.measurement.set_data(name=name)
         self.assertEqual(
@@ -454,9 +437,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_data_with_name_sets_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         dataset_id = "SimChan:02"
         name = (
             self.measurement.scan_modules["main"]
@@ -470,34 +451,16 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_sets_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimMot:02"
         self.measurement.set_axes(names=[name], scan_module="main")
-        common_elements = (
-            self.measurement.scan_modules["main"]
-            .data[name]
-            .position_counts[
-                np.isin(
-                    self.measurement.scan_modules["main"]
-                    .data[name]
-                    .position_counts,
-                    self.measurement.scan_modules["main"]
-                    .data[self.measurement.current_data]
-                    .position_counts,
-                )
-            ]
-        )
-        data_indices = np.searchsorted(
+        _, axes_indices, data_indices = np.intersect1d(
+            self.measurement.scan_modules["main"].data[name].position_counts,
             self.measurement.scan_modules["main"]
             .data[self.measurement.current_data]
             .position_counts,
-            common_elements,
-        )
-        axes_indices = np.searchsorted(
-            self.measurement.scan_modules["main"].data[name].position_counts,
-            common_elements,
+            assume_unique=True,
+            return_indices=True,
         )
         np.testing.assert_array_equal(
             self.measurement.data.axes[0].values[data_indices],
@@ -507,9 +470,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_sets_current_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimMot:02"
         self.measurement.set_axes(names=[name], scan_module="main")
         self.assertListEqual([name], self.measurement.current_axes)
@@ -519,9 +480,7 @@ class TestMeasurement(unittest.TestCase):
             self.measurement.current_axes = ["foo"]  # noqa
 
     def test_set_axes_sets_axis_metadata(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimMot:02"
         self.measurement.set_axes(names=[name], scan_module="main")
         self.assertEqual(
@@ -534,9 +493,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_with_name_sets_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         dataset_id = "SimMot:02"
         name = (
             self.measurement.scan_modules["main"]
@@ -544,31 +501,15 @@ class TestMeasurement(unittest.TestCase):
             .metadata.name
         )
         self.measurement.set_axes(names=[name], scan_module="main")
-        common_elements = (
+        _, axes_indices, data_indices = np.intersect1d(
             self.measurement.scan_modules["main"]
             .data[dataset_id]
-            .position_counts[
-                np.isin(
-                    self.measurement.scan_modules["main"]
-                    .data[dataset_id]
-                    .position_counts,
-                    self.measurement.scan_modules["main"]
-                    .data[self.measurement.current_data]
-                    .position_counts,
-                )
-            ]
-        )
-        data_indices = np.searchsorted(
-            self.measurement.scan_modules["main"]
-            .data[self.measurement.current_data]
             .position_counts,
-            common_elements,
-        )
-        axes_indices = np.searchsorted(
             self.measurement.scan_modules["main"]
-            .data[dataset_id]
+            .data[self.measurement.current_data]
             .position_counts,
-            common_elements,
+            assume_unique=True,
+            return_indices=True,
         )
         np.testing.assert_array_equal(
             self.measurement.data.axes[0].values[data_indices],
@@ -578,9 +519,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_get_name_returns_name(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         dataset_id = "SimMot:02"
         name = (
             self.measurement.scan_modules["main"]
@@ -590,9 +529,7 @@ class TestMeasurement(unittest.TestCase):
         self.assertEqual(name, self.measurement.get_name(dataset_id))
 
     def test_get_name_with_list_returns_list_of_names(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         dataset_id = ["SimMot:02", "SimChan:01"]
         names = [
             self.measurement.scan_modules["main"].data[device].metadata.name
@@ -601,9 +538,7 @@ class TestMeasurement(unittest.TestCase):
         self.assertListEqual(names, self.measurement.get_name(dataset_id))
 
     def test_set_data_if_no_preferred_data(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(set_preferred=False, scml=False)
-        self.measurement.load(filename=self.filename)
+        self._prepare("nopref_noscml")
         name = "SimChan:01"
         self.measurement.set_data(name=name)
         np.testing.assert_array_equal(
@@ -612,17 +547,13 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_if_no_preferred_data_raises(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(set_preferred=False)
-        self.measurement.load(filename=self.filename)
+        self._prepare("nopref")
         name = "SimMot:01"
         with self.assertRaisesRegex(ValueError, "No data to set axes for"):
             self.measurement.set_axes(names=[name])
 
     def test_set_data_with_field_name(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimChan:01"
         field = "position_counts"
         self.measurement.set_data(name=name, field=field)
@@ -632,9 +563,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_with_field_name(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimMot:01"
         field = "position_counts"
         self.measurement.set_axes(
@@ -646,9 +575,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_with_different_length_of_names_and_fields_raises(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         names = ["SimMot:01"]
         fields = ["position_counts", "data"]
         with self.assertRaisesRegex(
@@ -659,9 +586,7 @@ class TestMeasurement(unittest.TestCase):
             )
 
     def test_set_data_joins_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimChan:02"
         self.measurement.set_data(name=name)
         common_positions = np.intersect1d(
@@ -675,6 +600,7 @@ class TestMeasurement(unittest.TestCase):
             .data[self.measurement.current_axes[0]]
             .position_counts,
             common_positions,
+            assume_unique=True,
         )
         np.testing.assert_array_equal(
             self.measurement.data.axes[0].values[
@@ -686,9 +612,7 @@ class TestMeasurement(unittest.TestCase):
         )
 
     def test_set_axes_joins_axes(self):
-        h5file = DummyHDF5File(filename=self.filename)
-        h5file.create(scml=False)
-        self.measurement.load(filename=self.filename)
+        self._use_loaded("noscml")
         name = "SimMot:02"
         self.measurement.set_axes(names=[name], scan_module="main")
         common_positions = np.intersect1d(
@@ -702,6 +626,7 @@ class TestMeasurement(unittest.TestCase):
             .data[self.measurement.current_axes[0]]
             .position_counts,
             common_positions,
+            assume_unique=True,
         )
         self.assertEqual(
             len(self.measurement.data.data),
@@ -7,7 +7,11 @@ from evedata.measurement.controllers import joining
 
 
 class MockDevice:
-    def __init__(self, data=np.random.random(5), positions=np.arange(2, 7)):
+    def __init__(self, data=None, positions=None):
+        if data is None:
+            data = np.random.random(5)
+        if positions is None:
+            positions = np.arange(2, 7)
         self.data = data
         self.position_counts = positions
 
@@ -54,9 +58,12 @@ class TestJoin(unittest.TestCase):
         attributes = [
             "measurement",
         ]
-        for attribute in attributes:
-            with self.subTest(attribute=attribute):
-                self.assertTrue(hasattr(self.join, attribute))
+        missing = [
+            attribute
+            for attribute in attributes
+            if not hasattr(self.join, attribute)
+        ]
+        self.assertFalse(missing, f"Missing attributes: {missing}")
 
     def test_initialise_with_measurement_sets_measurement(self):
         measurement = "foo"
@@ -107,10 +114,10 @@ class TestAxesLastFill(unittest.TestCase):
     def test_join_returns_only_values_for_data_positions(self):
         self.join.measurement.scan_modules["main"].data = {
             "SimChan:01": MockDevice(
-                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+                data=np.random.random(5), positions=np.arange(0, 5)
             ),
             "SimMot:01": MockDevice(
-                data=np.random.random(7), positions=np.linspace(0, 6, 7)
+                data=np.random.random(7), positions=np.arange(0, 7)
             ),
         }
         result = self.join.join(
@@ -126,7 +133,7 @@ class TestAxesLastFill(unittest.TestCase):
                 data=np.random.random(4), positions=np.asarray([0, 2, 3, 4])
             ),
             "SimMot:01": MockDevice(
-                data=np.random.random(7), positions=np.linspace(0, 6, 7)
+                data=np.random.random(7), positions=np.arange(0, 7)
             ),
         }
         result = self.join.join(
@@ -139,10 +146,10 @@ class TestAxesLastFill(unittest.TestCase):
     def test_join_fills_axes_values(self):
         self.join.measurement.scan_modules["main"].data = {
             "SimChan:01": MockDevice(
-                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+                data=np.random.random(5), positions=np.arange(0, 5)
             ),
             "SimMot:01": MockDevice(
-                data=np.random.random(4), positions=np.linspace(0, 3, 4)
+                data=np.random.random(4), positions=np.arange(0, 4)
             ),
         }
         result = self.join.join(
@@ -156,14 +163,15 @@ class TestAxesLastFill(unittest.TestCase):
             result[1][:-1],
         )
         self.assertEqual(result[1][-2], result[1][-1])
+        self.assertNotIsInstance(result[1], ma.MaskedArray)
 
     def test_join_masks_axes_values_with_gap_at_beginning(self):
         self.join.measurement.scan_modules["main"].data = {
             "SimChan:01": MockDevice(
-                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+                data=np.random.random(5), positions=np.arange(0, 5)
             ),
             "SimMot:01": MockDevice(
-                data=np.random.random(3), positions=np.linspace(2, 4, 3)
+                data=np.random.random(3), positions=np.arange(2, 5)
             ),
         }
         result = self.join.join(
@@ -179,10 +187,28 @@ class TestAxesLastFill(unittest.TestCase):
         self.assertIsInstance(result[1], ma.masked_array)
         self.assertTrue(result[1].mask[0])
 
+    def test_join_masks_axes_value_with_single_gap_at_beginning(self):
+        self.join.measurement.scan_modules["main"].data = {
+            "SimChan:01": MockDevice(
+                data=np.random.random(5), positions=np.arange(0, 5)
+            ),
+            "SimMot:01": MockDevice(
+                data=np.random.random(4), positions=np.arange(1, 5)
+            ),
+        }
+        result = self.join.join(
+            data=("SimChan:01", None),
+            axes=(("SimMot:01", None),),
+            scan_module="main",
+        )
+        self.assertIsInstance(result[1], ma.masked_array)
+        self.assertTrue(result[1].mask[0])
+        self.assertFalse(np.any(result[1].mask[1:]))
+
     def test_join_fills_axes_values_with_gaps(self):
         self.join.measurement.scan_modules["main"].data = {
             "SimChan:01": MockDevice(
-                data=np.random.random(5), positions=np.linspace(0, 4, 5)
+                data=np.random.random(5), positions=np.arange(0, 5)
             ),
             "SimMot:01": MockDevice(
                 data=np.random.random(4), positions=np.asarray([0, 2, 4])
@@ -203,7 +229,7 @@ class TestAxesLastFill(unittest.TestCase):
             axes=(("SimMot:01", None),),
             scan_module="main",
         )
-        np.testing.assert_array_equal(
+        self.assertIs(
             self.join.measurement.scan_modules["main"]
             .data["SimChan:01"]
             .position_counts,
@@ -251,6 +277,30 @@ class TestAxesLastFill(unittest.TestCase):
             result[1][0],
         )
 
+    def test_join_uses_axes_values_following_snapshot(self):
+        self.join.measurement.scan_modules["main"].data = {
+            "SimChan:01": MockDevice(
+                data=np.random.random(5), positions=np.arange(2, 7)
+            ),
+            "SimMot:01": MockDevice(
+                data=np.random.random(4), positions=np.asarray([3, 4, 5, 6])
+            ),
+        }
+        self.join.measurement.device_snapshots = {
+            "SimMot:01": MockDevice(
+                data=np.random.random(2), positions=np.asarray([1, 7])
+            ),
+        }
+        result = self.join.join(
+            data=("SimChan:01", None),
+            axes=(("SimMot:01", None),),
+            scan_module="main",
+        )
+        np.testing.assert_array_equal(
+            self.join.measurement.scan_modules["main"].data["SimMot:01"].data,
+            result[1][1:],
+        )
+
 
 class TestJoinFactory(unittest.TestCase):
     def setUp(self):